@@ -1,15 +1,75 @@
+import json
 import os
-from flask import Flask, request, jsonify
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, List, Optional
+
+import requests
+from flask import Flask, request, jsonify, send_file, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from requests.adapters import HTTPAdapter
 from espn_api.football import League
+from espn_api.requests import espn_requests
 
 # Import database helper for cached player data
 import player_db
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (C/Rust encoder) instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+else:
+    # Without orjson, at least skip indentation, key sorting and ASCII escaping
+    app.json.compact = True
+    app.json.sort_keys = False
+    app.json.ensure_ascii = False
+
+
+def dumps_bytes(obj):
+    """Encode obj as JSON bytes - orjson when installed, compact stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=app.json.default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=app.json.default, ensure_ascii=False, separators=(",", ":")).encode()
+
 
 cors = CORS(app, resources={r"/parse-content": {"origins": "*"}, r"/api/*": {"origins": "*"}})
 
+# League objects are reused for this many seconds so dashboard reloads skip
+# the ESPN settings/teams/standings requests League() makes on construction
+LEAGUE_CACHE_TTL = 60
+LEAGUE_CACHE_MAXSIZE = 128
+
+# (league_id, year, espn_s2, swid) -> (expires_at, League)
+_league_cache = {}
+_league_build_locks = {}
+_league_cache_lock = threading.Lock()
+
+_HEADSHOT_PREFIX = "https://a.espncdn.com/i/headshots/nfl/players/full/"
+
+# Max player ids per batched player_info request, and concurrent requests in flight
+PLAYER_INFO_BATCH_SIZE = 50
+PLAYER_INFO_WORKERS = 16
+
 # ESPN Stat ID to readable name mapping
 ESPN_STAT_MAP = {
     # Passing
@@ -128,39 +188,229 @@ ESPN_STAT_MAP = {
 }
 
 
+# Intern the readable names so every serialized breakdown shares one copy of each key
+ESPN_STAT_MAP = {k: sys.intern(v) for k, v in ESPN_STAT_MAP.items()}
+
+# Lookup tables for convert_stat_keys, built once so the hot loop never has to
+# str() or isdigit() a key that ESPN already sent as an int. Stat ids are dense
+# (0-212), so int keys index straight into a list instead of hashing.
+# String keys are memoized in _STAT_MAP_STR as they are seen: espn_api mostly
+# sends names it already translated, which would otherwise miss the map and be
+# isdigit()-checked on every call.
+_MAX_STAT_ID = max(int(k) for k in ESPN_STAT_MAP)
+_STAT_ARRAY = [ESPN_STAT_MAP.get(str(stat_id)) for stat_id in range(_MAX_STAT_ID + 1)]
+_STAT_MAP_STR = dict(ESPN_STAT_MAP)
+
+
+def _readable_stat_key(key):
+    """Look a key up by its str() form, for keys the fast paths below don't cover"""
+    text = str(key)
+    readable_key = ESPN_STAT_MAP.get(text)
+    if readable_key is None:
+        # Numeric ids not in our map become 'unknownStat_<id>'; anything else is kept as-is
+        return f"unknownStat_{key}" if text.isdigit() else key
+    return readable_key
+
+
 def convert_stat_keys(breakdown):
     """Convert ESPN numeric stat IDs to readable names"""
+    # Bye weeks and future weeks have empty breakdowns
+    if not breakdown:
+        return {}
     converted = {}
     for key, value in breakdown.items():
-        # Try to convert numeric keys
-        readable_key = ESPN_STAT_MAP.get(str(key), key)
-        # If still numeric and not in our map, prefix with 'stat_'
-        if str(key).isdigit() and readable_key == key:
-            readable_key = f"unknownStat_{key}"
-        converted[readable_key] = value
+        if type(key) is int and 0 <= key <= _MAX_STAT_ID:
+            converted[_STAT_ARRAY[key] or f"unknownStat_{key}"] = value
+        elif type(key) is str:
+            readable_key = _STAT_MAP_STR.get(key)
+            if readable_key is None:
+                readable_key = _STAT_MAP_STR[key] = _readable_stat_key(key)
+            converted[readable_key] = value
+        else:
+            # Out-of-range or negative ints, bools, numpy ints, floats...
+            converted[_readable_stat_key(key)] = value
     return converted
 
 
-def serialize_player(player):
-    """Convert Player object to JSON-serializable dictionary"""
+class _PooledRequests:
+    """
+    Stand-in for the requests module used inside espn_api. get/post go through
+    one shared Session so ESPN calls reuse keep-alive connections instead of
+    doing a TLS handshake each; anything else falls through to requests.
+    """
+
+    def __init__(self, session):
+        self.get = session.get
+        self.post = session.post
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def _install_http_session():
+    """Route espn_api's HTTP calls through a pooled keep-alive Session."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    # Credentials are sent per request; never keep response cookies around,
+    # or they would leak between users sharing this session
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    if hasattr(espn_requests, "requests"):
+        espn_requests.requests = _PooledRequests(session)
+
+
+_install_http_session()
+
+
+def get_league(league_id, year, espn_s2=None, swid=None):
+    """
+    Get a League, reusing one built within the last LEAGUE_CACHE_TTL seconds.
+    Concurrent requests for the same league wait on a per-key lock so only one
+    of them pays for the cold build.
+    """
+    key = (league_id, year, espn_s2, swid)
+    with _league_cache_lock:
+        build_lock = _league_build_locks.setdefault(key, threading.Lock())
+    
+    with build_lock:
+        now = time.monotonic()
+        cached = _league_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        try:
+            league = League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
+        except Exception:
+            # Don't keep the lock or an expired entry (and the credentials in their key) around
+            with _league_cache_lock:
+                _league_cache.pop(key, None)
+                _league_build_locks.pop(key, None)
+            raise
+        
+        with _league_cache_lock:
+            # Drop expired entries on every insert, then the oldest ones past the size limit
+            for stale_key in [k for k, (expires_at, _) in _league_cache.items() if expires_at <= now]:
+                del _league_cache[stale_key]
+                if stale_key != key:
+                    _league_build_locks.pop(stale_key, None)
+            _league_cache[key] = (now + LEAGUE_CACHE_TTL, league)
+            while len(_league_cache) > LEAGUE_CACHE_MAXSIZE:
+                stale_key = next(iter(_league_cache))
+                del _league_cache[stale_key]
+                _league_build_locks.pop(stale_key, None)
+        return league
+
+
+def fetch_player_infos(league, player_ids):
+    """
+    Fetch full player info (weekly stats, schedule) for many players at once.
+    Ids are sent to ESPN in batches rather than one player_info call per player.
+    Returns a dict mapping playerId to Player; ids from a batch that failed
+    are left out.
+    """
+    batches = [
+        player_ids[start:start + PLAYER_INFO_BATCH_SIZE]
+        for start in range(0, len(player_ids), PLAYER_INFO_BATCH_SIZE)
+    ]
+    
+    def fetch(batch):
+        try:
+            result = league.player_info(playerId=batch)
+        except Exception as e:
+            # One failed batch only costs its players their full info; callers
+            # fall back to the basic roster data for ids missing from the result
+            app.logger.warning("player_info failed for %d players: %s", len(batch), e)
+            return []
+        if not result:
+            return []
+        # player_info returns a bare Player when only one id matched
+        return result if isinstance(result, list) else [result]
+    
+    players = {}
+    with ThreadPoolExecutor(max_workers=PLAYER_INFO_WORKERS) as executor:
+        for batch_players in executor.map(fetch, batches):
+            for player in batch_players:
+                players[player.playerId] = player
+    return players
+
+
+@dataclass(slots=True)
+class PlayerOut:
+    """Serialized player record. orjson encodes dataclasses natively, in field order."""
+    name: str
+    playerId: int
+    position: str
+    posRank: Optional[int]
+    eligibleSlots: List[str]
+    lineupSlot: Optional[str]
+    acquisitionType: Optional[str]
+    proTeam: str
+    onTeamId: Optional[int]
+    injuryStatus: Optional[str]
+    injured: bool
+    total_points: float
+    projected_total_points: float
+    avg_points: float
+    projected_avg_points: float
+    percent_owned: float
+    percent_started: float
+    stats: Dict[str, Any]
+    seasonTotals: Optional[Dict[str, Any]]
+    schedule: Dict[str, Any]
+    headshotUrl: Optional[str]
+
+
+@dataclass(slots=True)
+class TeamOut:
+    """Serialized fantasy team record."""
+    team_id: int
+    team_name: str
+    team_abbrev: str
+    division_id: int
+    division_name: str
+    wins: int
+    losses: int
+    ties: int
+    points_for: float
+    points_against: float
+    standing: int
+    final_standing: int
+    logo_url: str
+    streak_type: str
+    streak_length: int
+    playoff_pct: float
+
+
+def serialize_player(player, roster_player=None, current_week=None):
+    """
+    Convert Player object to a JSON-serializable PlayerOut.
+    lineupSlot/acquisitionType/onTeamId come from roster_player when given.
+    Weeks before current_week get an empty projected_breakdown.
+    """
     # Serialize weekly stats - filter out week 0 (season totals)
     weekly_stats = {}
     season_totals = None
     
-    if hasattr(player, 'stats') and player.stats:
-        for week, week_data in player.stats.items():
+    # Read attributes straight from the instance dict - espn_api sets them all
+    # in __init__, so this skips a getattr lookup + default per field
+    pd = vars(player)
+    
+    stats = pd.get('stats')
+    if stats:
+        # ESPN API can return different structures; decide once per player whether
+        # weeks are dicts (the common case) instead of isinstance-checking every week
+        dict_weeks = isinstance(next(iter(stats.values())), dict)
+        for week, week_data in stats.items():
             week_int = int(week) if isinstance(week, str) else week
             
-            # Handle both dict-style and object-style week_data
-            # ESPN API can return different structures
-            if isinstance(week_data, dict):
+            if dict_weeks:
+                get = week_data.get
                 # Try both 'points'/'total' and 'projected_points'/'projected_total' keys
-                points = week_data.get("points") or week_data.get("total", 0) or 0
-                projected_points = week_data.get("projected_points") or week_data.get("projected_total", 0) or 0
-                avg_points = week_data.get("avg_points", 0) or 0
-                projected_avg_points = week_data.get("projected_avg_points", 0) or 0
-                breakdown = week_data.get("breakdown", {}) or {}
-                projected_breakdown = week_data.get("projected_breakdown", {}) or {}
+                points = get("points") or get("total", 0) or 0
+                projected_points = get("projected_points") or get("projected_total", 0) or 0
+                avg_points = get("avg_points", 0) or 0
+                projected_avg_points = get("projected_avg_points", 0) or 0
+                breakdown = get("breakdown") or {}
+                projected_breakdown = get("projected_breakdown") or {}
             else:
                 # Handle object-style access
                 points = getattr(week_data, 'points', None) or getattr(week_data, 'total', 0) or 0
@@ -182,6 +432,10 @@ def serialize_player(player):
                 }
                 continue
                 
+            # Past weeks' projected breakdowns aren't shown, so don't convert or send them
+            if current_week is not None and week_int < current_week:
+                projected_breakdown = {}
+            
             weekly_stats[str(week)] = {
                 "points": points,
                 "projected_points": projected_points,
@@ -192,8 +446,9 @@ def serialize_player(player):
     
     # Serialize schedule - convert datetime to ISO string
     schedule = {}
-    if hasattr(player, 'schedule') and player.schedule:
-        for week, game_data in player.schedule.items():
+    player_schedule = pd.get('schedule')
+    if player_schedule:
+        for week, game_data in player_schedule.items():
             if isinstance(game_data, dict):
                 team = game_data.get("team", "")
                 date = game_data.get("date")
@@ -207,57 +462,68 @@ def serialize_player(player):
                 "date": date.isoformat() if date and hasattr(date, 'isoformat') else None,
             }
     
-    return {
-        "name": player.name,
-        "playerId": player.playerId,
-        "position": player.position,
-        "posRank": getattr(player, 'posRank', None),
-        "eligibleSlots": getattr(player, 'eligibleSlots', []),
-        "lineupSlot": getattr(player, 'lineupSlot', None),
-        "acquisitionType": getattr(player, 'acquisitionType', None),
-        "proTeam": player.proTeam,
-        "onTeamId": getattr(player, 'onTeamId', None),
-        "injuryStatus": getattr(player, 'injuryStatus', 'ACTIVE'),
-        "injured": getattr(player, 'injured', False),
-        "total_points": getattr(player, 'total_points', 0),
-        "projected_total_points": getattr(player, 'projected_total_points', 0),
-        "avg_points": getattr(player, 'avg_points', 0),
-        "projected_avg_points": getattr(player, 'projected_avg_points', 0),
-        "percent_owned": getattr(player, 'percent_owned', 0),
-        "percent_started": getattr(player, 'percent_started', 0),
-        "stats": weekly_stats,
-        "seasonTotals": season_totals,
-        "schedule": schedule,
-        "headshotUrl": f"https://a.espncdn.com/i/headshots/nfl/players/full/{player.playerId}.png" if player.playerId and player.playerId > 0 else None,
-    }
+    player_id = pd.get('playerId')
+    headshot_url = _HEADSHOT_PREFIX + str(player_id) + ".png" if player_id and player_id > 0 else None
+    rd = vars(roster_player) if roster_player is not None else pd
+    return PlayerOut(
+        name=pd.get('name'),
+        playerId=player_id,
+        position=pd.get('position'),
+        posRank=pd.get('posRank'),
+        eligibleSlots=pd.get('eligibleSlots', []),
+        lineupSlot=rd.get('lineupSlot'),
+        acquisitionType=rd.get('acquisitionType'),
+        proTeam=pd.get('proTeam'),
+        onTeamId=rd.get('onTeamId'),
+        injuryStatus=pd.get('injuryStatus', 'ACTIVE'),
+        injured=pd.get('injured', False),
+        total_points=pd.get('total_points', 0),
+        projected_total_points=pd.get('projected_total_points', 0),
+        avg_points=pd.get('avg_points', 0),
+        projected_avg_points=pd.get('projected_avg_points', 0),
+        percent_owned=pd.get('percent_owned', 0),
+        percent_started=pd.get('percent_started', 0),
+        stats=weekly_stats,
+        seasonTotals=season_totals,
+        schedule=schedule,
+        headshotUrl=headshot_url,
+    )
 
 
 def serialize_team(team):
-    """Convert Team object to JSON-serializable dictionary"""
-    return {
-        "team_id": team.team_id,
-        "team_name": team.team_name,
-        "team_abbrev": team.team_abbrev,
-        "division_id": team.division_id,
-        "division_name": team.division_name,
-        "wins": team.wins,
-        "losses": team.losses,
-        "ties": team.ties,
-        "points_for": team.points_for,
-        "points_against": team.points_against,
-        "standing": team.standing,
-        "final_standing": team.final_standing,
-        "logo_url": team.logo_url,
-        "streak_type": team.streak_type,
-        "streak_length": team.streak_length,
-        "playoff_pct": team.playoff_pct,
+    """Convert Team object to a JSON-serializable TeamOut"""
+    return TeamOut(
+        team_id=team.team_id,
+        team_name=team.team_name,
+        team_abbrev=team.team_abbrev,
+        division_id=team.division_id,
+        division_name=team.division_name,
+        wins=team.wins,
+        losses=team.losses,
+        ties=team.ties,
+        points_for=team.points_for,
+        points_against=team.points_against,
+        standing=team.standing,
+        final_standing=team.final_standing,
+        logo_url=team.logo_url,
+        streak_type=team.streak_type,
+        streak_length=team.streak_length,
+        playoff_pct=team.playoff_pct,
+    )
+
+
+def prune_past_projections(player, current_week):
+    """Empty projected_breakdown for weeks before current_week on a DB-cached player dict"""
+    player["stats"] = {
+        week: {**week_stats, "projected_breakdown": {}} if int(week) < current_week else week_stats
+        for week, week_stats in player["stats"].items()
     }
 
 
 @app.route('/parse-content', methods=['POST'])
 def parse_content():
     data = request.json
-    league = League(
+    league = get_league(
         league_id=data["leagueId"],
         year=2025,
         espn_s2=data.get("espn_s2"),
@@ -266,60 +532,84 @@ def parse_content():
     
     # Check if we should use cached database
     use_db = player_db.database_exists()
+    current_week = getattr(league, 'current_week', None)
     
-    # Serialize teams
-    teams = [serialize_team(team) for team in league.teams]
+    # Serialize teams once; standings() returns the same Team objects, just reordered
+    teams_by_id = {team.team_id: serialize_team(team) for team in league.teams}
+    teams = list(teams_by_id.values())
+    standings = [teams_by_id[team.team_id] for team in league.standings()]
     
-    # Serialize standings (also Team objects)
-    standings = [serialize_team(team) for team in league.standings()]
+    # Try to get roster players from database first (much faster)
+    # (one IN query per table for the whole league)
+    roster_ids = [roster_player.playerId for team in league.teams for roster_player in team.roster]
+    cached_players = player_db.get_players_bulk(roster_ids) if use_db else {}
     
-    # Serialize rosters - dict with team_name as key and list of players as value
-    rosters = {}
+    # Fetch full player info for every cache miss in a handful of batched requests
+    # instead of one player_info round-trip per player
+    missing_ids = [player_id for player_id in roster_ids if player_id not in cached_players]
+    full_players = fetch_player_infos(league, missing_ids) if missing_ids else {}
+    
+    # Build rosters - team_name with its list of players. Everything that can
+    # fail runs here, before the response starts, so an error is still a 500
+    # instead of a 200 with a truncated body.
+    rosters = []
     for team in league.teams:
         roster_players = []
         for roster_player in team.roster:
-            if use_db:
-                # Try to get player from database first (much faster)
-                cached_player = player_db.get_player(roster_player.playerId)
-                if cached_player:
-                    # Override with roster-specific data
-                    cached_player["lineupSlot"] = getattr(roster_player, 'lineupSlot', None)
-                    cached_player["acquisitionType"] = getattr(roster_player, 'acquisitionType', None)
-                    cached_player["onTeamId"] = getattr(roster_player, 'onTeamId', None)
-                    roster_players.append(cached_player)
-                    continue
-            
-            # Fallback: Get full player info with all weekly stats using player_info
-            full_player = league.player_info(playerId=roster_player.playerId)
-            if full_player:
-                # Serialize full player but preserve roster-specific fields from original
-                serialized = serialize_player(full_player)
+            serialized = cached_players.get(roster_player.playerId)
+            if serialized is None:
+                # Fallback to basic roster player if player_info fails
+                full_player = full_players.get(roster_player.playerId)
+                serialized = serialize_player(full_player or roster_player, roster_player, current_week)
+            else:
                 # Override with roster-specific data (lineupSlot, acquisitionType, etc.)
                 serialized["lineupSlot"] = getattr(roster_player, 'lineupSlot', None)
                 serialized["acquisitionType"] = getattr(roster_player, 'acquisitionType', None)
                 serialized["onTeamId"] = getattr(roster_player, 'onTeamId', None)
-                roster_players.append(serialized)
-            else:
-                # Fallback to basic roster player if player_info fails
-                roster_players.append(serialize_player(roster_player))
-        rosters[team.team_name] = roster_players
+                if current_week is not None:
+                    prune_past_projections(serialized, current_week)
+            roster_players.append(serialized)
+        rosters.append((team.team_name, roster_players))
     
-    return jsonify({
-        "standings": standings,
-        "teams": teams,
-        "rosters": rosters,
-    }), 200
+    # Stream the encoded response one player at a time, so the full JSON body
+    # is never held in memory
+    def stream():
+        yield b'{"standings":'
+        yield dumps_bytes(standings)
+        yield b',"teams":'
+        yield dumps_bytes(teams)
+        yield b',"rosters":{'
+        for team_index, (team_name, roster_players) in enumerate(rosters):
+            yield (b',' if team_index else b'') + dumps_bytes(team_name) + b':['
+            for player_index, serialized in enumerate(roster_players):
+                yield (b',' if player_index else b'') + dumps_bytes(serialized)
+            yield b']'
+        yield b'}}'
+    
+    return app.response_class(stream_with_context(stream()), mimetype='application/json'), 200
 
 
 @app.route('/api/player/<int:player_id>', methods=['GET'])
 def get_player(player_id):
     """Get a single player by ID from the database."""
-    player = player_db.get_player(player_id)
-    if player:
-        return jsonify(player), 200
+    # Forward the stored JSON without decoding and re-encoding it
+    payload = player_db.get_player_raw_json(player_id)
+    if payload:
+        return app.response_class(payload, mimetype='application/json'), 200
     return jsonify({"error": "Player not found"}), 404
 
 
+def stream_json_array(items):
+    """Stream items as a JSON array response, encoding each one as it is read."""
+    def stream():
+        yield b'['
+        for index, item in enumerate(items):
+            yield (b',' if index else b'') + dumps_bytes(item)
+        yield b']'
+    
+    return app.response_class(stream_with_context(stream()), mimetype='application/json')
+
+
 @app.route('/api/players/search', methods=['GET'])
 def search_players():
     """Search for players by name, position, or team."""
@@ -332,9 +622,22 @@ def search_players():
         name=name,
         position=position,
         pro_team=pro_team,
-        limit=limit
+        limit=limit,
+        yield_rows=True
     )
-    return jsonify(players), 200
+    
+    # Large limits return thousands of rows - encode them as they are read
+    return stream_json_array(players), 200
+
+
+@app.route('/api/players', methods=['GET'])
+def all_players():
+    """Basic info for all players, sent from the catalog file written by build_player_db.py."""
+    try:
+        return send_file(os.path.abspath(player_db.basic_catalog_path()), mimetype='application/json')
+    except FileNotFoundError:
+        # No catalog yet (or a build is running) - read the players from the database
+        return stream_json_array(player_db.get_all_players_basic(yield_rows=True)), 200
 
 
 @app.route('/api/db/status', methods=['GET'])
@@ -349,4 +652,5 @@ def db_status():
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # Development server only - use gunicorn.conf.py in production
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1")
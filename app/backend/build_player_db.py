@@ -16,19 +16,119 @@ For private leagues, you'll need to provide espn_s2 and swid cookies.
 import argparse
 import json
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Set, Dict
+from typing import Optional, Set, Dict, List
 from espn_api.football import League
 
 # Import the stat mapping from app.py
-from app import ESPN_STAT_MAP, convert_stat_keys
+from app import ESPN_STAT_MAP, convert_stat_keys, fetch_player_infos
+import player_db
 
 
-def create_database(db_path: str = "players.db"):
-    """Create the SQLite database and tables."""
-    conn = sqlite3.connect(db_path)
+# Rows buffered per statement before they are written with executemany
+BATCH_SIZE = 1000
+
+
+class RowBatch:
+    """
+    Buffers rows per SQL statement and writes each buffer with a single
+    executemany once batch_size rows are queued, instead of one execute per row.
+    Call flush() before committing.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = BATCH_SIZE):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.pending: Dict[str, List[tuple]] = {}
+
+    def add(self, sql: str, row: tuple):
+        rows = self.pending.setdefault(sql, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self._write(sql, rows)
+
+    def flush(self):
+        for sql, rows in self.pending.items():
+            if rows:
+                self._write(sql, rows)
+
+    def _write(self, sql: str, rows: List[tuple]):
+        """
+        Write one buffer. If the batch fails, undo its partial writes and retry
+        row by row so one bad row is skipped instead of losing the whole batch.
+        The buffer is always cleared.
+        """
+        # Outside a transaction the SAVEPOINT would start its own, and RELEASE
+        # would commit each batch separately
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT row_batch")
+        try:
+            self.conn.executemany(sql, rows)
+        except (sqlite3.Error, OverflowError):
+            self.conn.execute("ROLLBACK TO row_batch")
+            for row in rows:
+                try:
+                    self.conn.execute(sql, row)
+                except (sqlite3.Error, OverflowError) as e:
+                    print(f"  Skipping row {row!r}: {e}")
+        finally:
+            self.conn.execute("RELEASE row_batch")
+            rows.clear()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """Run the block as one explicit BEGIN/COMMIT (connections are in autocommit mode)."""
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+# Concurrent league.box_scores() requests when updating weekly projections
+BOX_SCORE_WORKERS = 8
+
+# Secondary indexes. They are dropped before a bulk load and built once afterwards,
+# instead of being updated on every inserted row. The UNIQUE constraints that the
+# ON CONFLICT upserts rely on are part of the tables and stay in place.
+SECONDARY_INDEXES = {
+    "idx_players_name": "CREATE INDEX IF NOT EXISTS idx_players_name ON players(name)",
+    "idx_players_position": "CREATE INDEX IF NOT EXISTS idx_players_position ON players(position)",
+    "idx_players_pro_team": "CREATE INDEX IF NOT EXISTS idx_players_pro_team ON players(pro_team)",
+    # search_players / the catalog order by total_points: walk this index instead of sorting
+    "idx_players_total_points": "CREATE INDEX IF NOT EXISTS idx_players_total_points ON players(total_points DESC, player_id)",
+    "idx_weekly_stats_week": "CREATE INDEX IF NOT EXISTS idx_weekly_stats_week ON player_weekly_stats(week)",
+}
+
+# Indexes older databases may still have. Lookups by player (ordered by week) on
+# player_weekly_stats and player_schedule are served by the UNIQUE(player_id, week)
+# indexes, which makes a separate player_id index pure write overhead.
+REDUNDANT_INDEXES = ["idx_weekly_stats_player"]
+
+
+def create_schema(db_path: str = "players.db"):
+    """
+    Create the SQLite database and tables (without secondary indexes).
+    The connection is in autocommit mode (isolation_level=None); wrap writes in transaction().
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
     cursor = conn.cursor()
     
+    # Bulk-load tuning: WAL + synchronous=NORMAL avoids an fsync per commit, and a
+    # large page cache/mmap keeps index pages hot during the UPSERTs
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-200000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA foreign_keys=OFF")
+    
     # Players table - basic player info
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS players (
@@ -47,10 +147,16 @@ def create_database(db_path: str = "players.db"):
             percent_owned REAL,
             percent_started REAL,
             headshot_url TEXT,
-            updated_at TEXT
+            updated_at TEXT,
+            payload BLOB
         )
     """)
     
+    # Databases built before the payload column existed need it added
+    cursor.execute("PRAGMA table_info(players)")
+    if "payload" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE players ADD COLUMN payload BLOB")
+    
     # Weekly stats table - stats for each week (0-17)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS player_weekly_stats (
@@ -94,17 +200,21 @@ def create_database(db_path: str = "players.db"):
         )
     """)
     
-    # Create indexes for faster queries
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_name ON players(name)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_position ON players(position)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_pro_team ON players(pro_team)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_weekly_stats_player ON player_weekly_stats(player_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_weekly_stats_week ON player_weekly_stats(week)")
-    
-    conn.commit()
     return conn
 
 
+def drop_indexes(conn: sqlite3.Connection):
+    """Drop the secondary indexes before a bulk load."""
+    for name in [*SECONDARY_INDEXES, *REDUNDANT_INDEXES]:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def create_indexes(conn: sqlite3.Connection):
+    """Create the secondary indexes for faster queries (after the bulk load)."""
+    for sql in SECONDARY_INDEXES.values():
+        conn.execute(sql)
+
+
 def get_existing_player_ids(conn: sqlite3.Connection) -> Set[int]:
     """Get set of player IDs that already exist in the database."""
     cursor = conn.cursor()
@@ -131,32 +241,28 @@ def get_players_needing_stats(conn: sqlite3.Connection, min_weeks: int = 5) -> S
 
 def get_weeks_missing_projections(conn: sqlite3.Connection, current_week: int) -> Dict[int, Set[int]]:
     """Get dict of player_id -> set of weeks missing projections."""
-    cursor = conn.cursor()
-    
-    # Get all players
-    cursor.execute("SELECT player_id FROM players")
-    all_players = {row[0] for row in cursor.fetchall()}
+    last_week = min(current_week + 1, 17)
+    if last_week < 1:
+        return {}
     
-    # Get existing projections
+    # Cross every player with the wanted weeks and keep the pairs that have no
+    # projection, so the diff happens in SQLite rather than in Python sets
+    cursor = conn.cursor()
     cursor.execute("""
-        SELECT player_id, week FROM player_weekly_stats 
-        WHERE projected_points > 0
-    """)
-    existing = {}
-    for row in cursor.fetchall():
-        if row[0] not in existing:
-            existing[row[0]] = set()
-        existing[row[0]].add(row[1])
-    
-    # Find missing weeks for each player
-    all_weeks = set(range(1, min(current_week + 2, 18)))
-    missing = {}
-    for player_id in all_players:
-        player_weeks = existing.get(player_id, set())
-        missing_weeks = all_weeks - player_weeks
-        if missing_weeks:
-            missing[player_id] = missing_weeks
+        WITH RECURSIVE weeks(week) AS (
+            SELECT 1 UNION ALL SELECT week + 1 FROM weeks WHERE week < ?
+        )
+        SELECT p.player_id, w.week
+        FROM players p CROSS JOIN weeks w
+        WHERE NOT EXISTS (
+            SELECT 1 FROM player_weekly_stats s
+            WHERE s.player_id = p.player_id AND s.week = w.week AND s.projected_points > 0
+        )
+    """, (last_week,))
     
+    missing = {}
+    for player_id, week in cursor.fetchall():
+        missing.setdefault(player_id, set()).add(week)
     return missing
 
 
@@ -184,9 +290,28 @@ def extract_week_data(week_data):
     }
 
 
+# Generated D/ST ids by pro team abbreviation
+_DST_IDS: Dict[str, int] = {}
+
+
+def get_dst_player_id(pro_team: str) -> int:
+    """
+    Generate a consistent negative ID for D/ST based on team abbreviation.
+    This creates a unique ID like -100 to -132 for each NFL team.
+    """
+    player_id = _DST_IDS.get(pro_team)
+    if player_id is None:
+        team_hash = sum(ord(c) for c in pro_team) % 100
+        player_id = _DST_IDS[pro_team] = -(1000 + team_hash)
+    return player_id
+
+
 def get_player_id(player) -> Optional[int]:
     """Get player ID, handling both regular players and D/ST."""
     player_id = getattr(player, 'playerId', None)
+    # Regular players - nothing else to check
+    if type(player_id) is int:
+        return player_id
     if player_id is None:
         # Try alternate attribute names
         player_id = getattr(player, 'player_id', None)
@@ -204,10 +329,7 @@ def get_player_id(player) -> Optional[int]:
         position = getattr(player, 'position', '')
         pro_team = getattr(player, 'proTeam', '')
         if position == 'D/ST' and pro_team:
-            # Generate a consistent negative ID for D/ST based on team abbreviation
-            # This creates a unique ID like -100 to -132 for each NFL team
-            team_hash = sum(ord(c) for c in pro_team) % 100
-            player_id = -(1000 + team_hash)
+            player_id = get_dst_player_id(pro_team)
     
     return player_id
 
@@ -224,28 +346,162 @@ def get_player_name(player) -> str:
     return name or 'Unknown'
 
 
+_HEADSHOT_PREFIX = "https://a.espncdn.com/i/headshots/nfl/players/full/"
+
+# Team logo URLs by pro team abbreviation (one per NFL team, built on first use)
+_DST_LOGO_URLS: Dict[str, str] = {}
+
+
 def get_headshot_url(player_id: int, position: str, pro_team: str) -> Optional[str]:
     """Get headshot URL, handling D/ST differently."""
     if position == 'D/ST':
         # Use team logo for D/ST
         if pro_team:
-            return f"https://a.espncdn.com/i/teamlogos/nfl/500/{pro_team.lower()}.png"
+            url = _DST_LOGO_URLS.get(pro_team)
+            if url is None:
+                url = _DST_LOGO_URLS[pro_team] = f"https://a.espncdn.com/i/teamlogos/nfl/500/{pro_team.lower()}.png"
+            return url
         return None
     elif player_id and player_id > 0:
-        return f"https://a.espncdn.com/i/headshots/nfl/players/full/{player_id}.png"
+        return _HEADSHOT_PREFIX + str(player_id) + ".png"
     return None
 
 
+# Statements used by the loaders, defined once so every call (and every RowBatch
+# buffer, which is keyed by statement) shares the same SQL text. Writes to a
+# player's rows clear its payload (rebuilt by refresh_payloads at the end of the
+# build), so readers assemble from the tables until then instead of serving the
+# old blob. INSERT OR REPLACE already leaves the payload column empty.
+SQL_PARTIAL_UPDATE_PLAYER = """
+    UPDATE players SET
+        injury_status = ?,
+        injured = ?,
+        total_points = MAX(?, total_points),
+        projected_total_points = CASE WHEN ? > 0 THEN ? ELSE projected_total_points END,
+        avg_points = CASE WHEN ? > 0 THEN ? ELSE avg_points END,
+        projected_avg_points = CASE WHEN ? > 0 THEN ? ELSE projected_avg_points END,
+        percent_owned = ?,
+        percent_started = ?,
+        updated_at = ?,
+        payload = NULL
+    WHERE player_id = ?
+"""
+
+# Same as SQL_PARTIAL_UPDATE_PLAYER for a player with no projected/average points,
+# whose CASE columns would all keep their stored values
+SQL_UPDATE_PLAYER_STATUS = """
+    UPDATE players SET
+        injury_status = ?,
+        injured = ?,
+        total_points = MAX(?, total_points),
+        percent_owned = ?,
+        percent_started = ?,
+        updated_at = ?,
+        payload = NULL
+    WHERE player_id = ?
+"""
+
+SQL_INSERT_PLAYER = """
+    INSERT OR REPLACE INTO players (
+        player_id, name, position, pro_team, pos_rank, eligible_slots,
+        injury_status, injured, total_points, projected_total_points,
+        avg_points, projected_avg_points, percent_owned, percent_started,
+        headshot_url, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SQL_UPSERT_SEASON = """
+    INSERT INTO player_season_totals (
+        player_id, points, projected_points, avg_points,
+        projected_avg_points, breakdown, projected_breakdown
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(player_id) DO UPDATE SET
+        points = MAX(excluded.points, player_season_totals.points),
+        projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_season_totals.projected_points END,
+        avg_points = CASE WHEN excluded.avg_points > 0 THEN excluded.avg_points ELSE player_season_totals.avg_points END,
+        projected_avg_points = CASE WHEN excluded.projected_avg_points > 0 THEN excluded.projected_avg_points ELSE player_season_totals.projected_avg_points END,
+        breakdown = CASE WHEN length(excluded.breakdown) > 2 THEN excluded.breakdown ELSE player_season_totals.breakdown END,
+        projected_breakdown = CASE WHEN length(excluded.projected_breakdown) > 2 THEN excluded.projected_breakdown ELSE player_season_totals.projected_breakdown END
+"""
+
+SQL_UPSERT_WEEKLY = """
+    INSERT INTO player_weekly_stats (
+        player_id, week, points, projected_points, avg_points,
+        breakdown, projected_breakdown
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(player_id, week) DO UPDATE SET
+        points = CASE WHEN excluded.points > 0 THEN excluded.points ELSE player_weekly_stats.points END,
+        projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_weekly_stats.projected_points END,
+        avg_points = CASE WHEN excluded.avg_points > 0 THEN excluded.avg_points ELSE player_weekly_stats.avg_points END,
+        breakdown = CASE WHEN length(excluded.breakdown) > 2 THEN excluded.breakdown ELSE player_weekly_stats.breakdown END,
+        projected_breakdown = CASE WHEN length(excluded.projected_breakdown) > 2 THEN excluded.projected_breakdown ELSE player_weekly_stats.projected_breakdown END
+"""
+
+SQL_UPSERT_SCHEDULE = """
+    INSERT OR REPLACE INTO player_schedule (
+        player_id, week, opponent_team, game_date
+    ) VALUES (?, ?, ?, ?)
+"""
+
+SQL_INSERT_BOX_PLAYER = """
+    INSERT OR IGNORE INTO players (player_id, name, position, pro_team, headshot_url, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# For players whose stats change without a players row write (box scores)
+SQL_CLEAR_PAYLOAD = "UPDATE players SET payload = NULL WHERE player_id = ?"
+
+SQL_UPSERT_BOX_WEEKLY = """
+    INSERT INTO player_weekly_stats (player_id, week, points, projected_points, avg_points, breakdown, projected_breakdown)
+    VALUES (?, ?, ?, ?, 0, ?, ?)
+    ON CONFLICT(player_id, week) DO UPDATE SET
+        projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_weekly_stats.projected_points END,
+        points = CASE WHEN excluded.points > 0 THEN excluded.points ELSE player_weekly_stats.points END,
+        breakdown = CASE WHEN length(excluded.breakdown) > 2 THEN excluded.breakdown ELSE player_weekly_stats.breakdown END,
+        projected_breakdown = CASE WHEN length(excluded.projected_breakdown) > 2 THEN excluded.projected_breakdown ELSE player_weekly_stats.projected_breakdown END
+"""
+
+
+# Most breakdowns (bye weeks, future weeks) and many slot lists are empty, so
+# their serialized forms are constants rather than a json.dumps call each
+_EMPTY_OBJ_JSON = '{}'
+_EMPTY_ARR_JSON = '[]'
+
+
 def safe_json_dumps(value):
     """Safely convert a value to JSON string, handling edge cases."""
-    if value is None:
-        return '[]'
+    if value is None or value == []:
+        return _EMPTY_ARR_JSON
     if isinstance(value, str):
         return value
     try:
         return json.dumps(value)
     except (TypeError, ValueError):
-        return '[]'
+        return _EMPTY_ARR_JSON
+
+
+# Encoded breakdowns keyed by their items. Identical breakdowns repeat across
+# weeks and players (e.g. D/ST and kicker projections), so they are encoded once.
+_BREAKDOWN_JSON_CACHE: Dict[tuple, str] = {}
+_BREAKDOWN_JSON_CACHE_SIZE = 4096
+
+
+def dumps_breakdown(breakdown: dict) -> str:
+    """Serialize a stat breakdown for a breakdown column."""
+    if not breakdown:
+        return _EMPTY_OBJ_JSON
+    try:
+        # Value types are part of the key so 1 and 1.0 don't share an encoding
+        key = (tuple(breakdown.items()), tuple(map(type, breakdown.values())))
+        encoded = _BREAKDOWN_JSON_CACHE.get(key)
+    except TypeError:
+        # Unhashable values - just encode
+        return json.dumps(breakdown)
+    if encoded is None:
+        if len(_BREAKDOWN_JSON_CACHE) >= _BREAKDOWN_JSON_CACHE_SIZE:
+            _BREAKDOWN_JSON_CACHE.clear()
+        encoded = _BREAKDOWN_JSON_CACHE[key] = json.dumps(breakdown)
+    return encoded
 
 
 def safe_get_numeric(obj, attr, default=0):
@@ -258,10 +514,12 @@ def safe_get_numeric(obj, attr, default=0):
     return default
 
 
-def insert_or_update_player(conn, player, full_player_info=None, force_update: bool = False):
-    """Insert or update a player and their stats in the database."""
-    cursor = conn.cursor()
-    
+def insert_or_update_player(batch: RowBatch, stored_ids: Set[int], player, full_player_info=None, force_update: bool = False):
+    """
+    Queue inserts/updates for a player and their stats on the batch.
+    stored_ids holds the ids already in the players table (queued writes included)
+    and is updated here. Nothing is committed - the caller flushes and commits.
+    """
     # Use full_player_info if available, otherwise use basic player
     p = full_player_info if full_player_info else player
     
@@ -279,9 +537,7 @@ def insert_or_update_player(conn, player, full_player_info=None, force_update: b
     if not isinstance(eligible_slots, list):
         eligible_slots = []
     
-    # Check if player exists
-    cursor.execute("SELECT updated_at FROM players WHERE player_id = ?", (player_id,))
-    existing = cursor.fetchone()
+    existing = player_id in stored_ids
     
     # Get values safely
     total_pts = safe_get_numeric(p, 'total_points', 0)
@@ -296,24 +552,23 @@ def insert_or_update_player(conn, player, full_player_info=None, force_update: b
     if pos_rank is not None and not isinstance(pos_rank, int):
         pos_rank = None
     
-    if existing and not force_update:
+    if existing and not force_update and proj_total_pts <= 0 and avg_pts <= 0 and proj_avg_pts <= 0:
+        # Nothing projected - only the status fields (injury, percent owned, etc.) change
+        batch.add(SQL_UPDATE_PLAYER_STATUS, (
+            injury_status,
+            injured,
+            total_pts,
+            pct_owned,
+            pct_started,
+            now,
+            player_id
+        ))
+    elif existing and not force_update:
         # Only update dynamic fields (injury status, percent owned, etc.)
-        cursor.execute("""
-            UPDATE players SET
-                injury_status = ?,
-                injured = ?,
-                total_points = CASE WHEN ? > total_points THEN ? ELSE total_points END,
-                projected_total_points = CASE WHEN ? > 0 THEN ? ELSE projected_total_points END,
-                avg_points = CASE WHEN ? > 0 THEN ? ELSE avg_points END,
-                projected_avg_points = CASE WHEN ? > 0 THEN ? ELSE projected_avg_points END,
-                percent_owned = ?,
-                percent_started = ?,
-                updated_at = ?
-            WHERE player_id = ?
-        """, (
+        batch.add(SQL_PARTIAL_UPDATE_PLAYER, (
             injury_status,
             injured,
-            total_pts, total_pts,
+            total_pts,
             proj_total_pts, proj_total_pts,
             avg_pts, avg_pts,
             proj_avg_pts, proj_avg_pts,
@@ -324,14 +579,7 @@ def insert_or_update_player(conn, player, full_player_info=None, force_update: b
         ))
     else:
         # Insert or fully replace
-        cursor.execute("""
-            INSERT OR REPLACE INTO players (
-                player_id, name, position, pro_team, pos_rank, eligible_slots,
-                injury_status, injured, total_points, projected_total_points,
-                avg_points, projected_avg_points, percent_owned, percent_started,
-                headshot_url, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        batch.add(SQL_INSERT_PLAYER, (
             player_id,
             name,
             position,
@@ -358,48 +606,25 @@ def insert_or_update_player(conn, player, full_player_info=None, force_update: b
             
             if week_int == 0:
                 # Season totals - use UPSERT logic
-                cursor.execute("""
-                    INSERT INTO player_season_totals (
-                        player_id, points, projected_points, avg_points,
-                        projected_avg_points, breakdown, projected_breakdown
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(player_id) DO UPDATE SET
-                        points = CASE WHEN excluded.points > player_season_totals.points THEN excluded.points ELSE player_season_totals.points END,
-                        projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_season_totals.projected_points END,
-                        avg_points = CASE WHEN excluded.avg_points > 0 THEN excluded.avg_points ELSE player_season_totals.avg_points END,
-                        projected_avg_points = CASE WHEN excluded.projected_avg_points > 0 THEN excluded.projected_avg_points ELSE player_season_totals.projected_avg_points END,
-                        breakdown = CASE WHEN excluded.breakdown != '{}' THEN excluded.breakdown ELSE player_season_totals.breakdown END,
-                        projected_breakdown = CASE WHEN excluded.projected_breakdown != '{}' THEN excluded.projected_breakdown ELSE player_season_totals.projected_breakdown END
-                """, (
+                batch.add(SQL_UPSERT_SEASON, (
                     player_id,
                     stats["points"],
                     stats["projected_points"],
                     stats["avg_points"],
                     week_data.get("projected_avg_points", 0) if isinstance(week_data, dict) else getattr(week_data, 'projected_avg_points', 0) or 0,
-                    json.dumps(stats["breakdown"]),
-                    json.dumps(stats["projected_breakdown"])
+                    dumps_breakdown(stats["breakdown"]),
+                    dumps_breakdown(stats["projected_breakdown"])
                 ))
             else:
                 # Weekly stats - use UPSERT logic to not overwrite good data
-                cursor.execute("""
-                    INSERT INTO player_weekly_stats (
-                        player_id, week, points, projected_points, avg_points,
-                        breakdown, projected_breakdown
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(player_id, week) DO UPDATE SET
-                        points = CASE WHEN excluded.points > 0 THEN excluded.points ELSE player_weekly_stats.points END,
-                        projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_weekly_stats.projected_points END,
-                        avg_points = CASE WHEN excluded.avg_points > 0 THEN excluded.avg_points ELSE player_weekly_stats.avg_points END,
-                        breakdown = CASE WHEN excluded.breakdown != '{}' THEN excluded.breakdown ELSE player_weekly_stats.breakdown END,
-                        projected_breakdown = CASE WHEN excluded.projected_breakdown != '{}' THEN excluded.projected_breakdown ELSE player_weekly_stats.projected_breakdown END
-                """, (
+                batch.add(SQL_UPSERT_WEEKLY, (
                     player_id,
                     week_int,
                     stats["points"],
                     stats["projected_points"],
                     stats["avg_points"],
-                    json.dumps(stats["breakdown"]),
-                    json.dumps(stats["projected_breakdown"])
+                    dumps_breakdown(stats["breakdown"]),
+                    dumps_breakdown(stats["projected_breakdown"])
                 ))
     
     # Insert/update schedule
@@ -414,23 +639,19 @@ def insert_or_update_player(conn, player, full_player_info=None, force_update: b
                 team = getattr(game_data, 'team', str(game_data)) if hasattr(game_data, 'team') else str(game_data)
                 date = getattr(game_data, 'date', None) if hasattr(game_data, 'date') else None
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO player_schedule (
-                    player_id, week, opponent_team, game_date
-                ) VALUES (?, ?, ?, ?)
-            """, (
+            batch.add(SQL_UPSERT_SCHEDULE, (
                 player_id,
                 week_int,
                 team,
                 date.isoformat() if date and hasattr(date, 'isoformat') else None
             ))
     
-    conn.commit()
+    stored_ids.add(player_id)
     return True
 
 
-def process_box_player(cursor, box_player, week: int):
-    """Process a BoxPlayer object and update the database."""
+def process_box_player(batch: RowBatch, box_player, week: int):
+    """Process a BoxPlayer object and queue its database writes on the batch."""
     try:
         player_id = get_player_id(box_player)
         if player_id is None:
@@ -456,10 +677,7 @@ def process_box_player(cursor, box_player, week: int):
         position = getattr(box_player, 'position', None) or 'Unknown'
         pro_team = getattr(box_player, 'proTeam', None) or ''
         
-        cursor.execute("""
-            INSERT OR IGNORE INTO players (player_id, name, position, pro_team, headshot_url, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        batch.add(SQL_INSERT_BOX_PLAYER, (
             player_id,
             name,
             position,
@@ -469,22 +687,15 @@ def process_box_player(cursor, box_player, week: int):
         ))
         
         # Update weekly stats with projections
-        cursor.execute("""
-            INSERT INTO player_weekly_stats (player_id, week, points, projected_points, avg_points, breakdown, projected_breakdown)
-            VALUES (?, ?, ?, ?, 0, ?, ?)
-            ON CONFLICT(player_id, week) DO UPDATE SET
-                projected_points = CASE WHEN excluded.projected_points > 0 THEN excluded.projected_points ELSE player_weekly_stats.projected_points END,
-                points = CASE WHEN excluded.points > 0 THEN excluded.points ELSE player_weekly_stats.points END,
-                breakdown = CASE WHEN excluded.breakdown != '{}' THEN excluded.breakdown ELSE player_weekly_stats.breakdown END,
-                projected_breakdown = CASE WHEN excluded.projected_breakdown != '{}' THEN excluded.projected_breakdown ELSE player_weekly_stats.projected_breakdown END
-        """, (
+        batch.add(SQL_UPSERT_BOX_WEEKLY, (
             player_id,
             week,
             actual_pts,
             projected_pts,
-            json.dumps(breakdown),
-            json.dumps(proj_breakdown)
+            dumps_breakdown(breakdown),
+            dumps_breakdown(proj_breakdown)
         ))
+        batch.add(SQL_CLEAR_PAYLOAD, (player_id,))
         return True
     except Exception as e:
         return False
@@ -494,8 +705,9 @@ def update_weekly_projections_from_box_scores(league: League, conn: sqlite3.Conn
     """
     Fetch box scores for each week to get projected points from BoxPlayer objects.
     BoxPlayer contains projected_points that player_info doesn't provide.
+    Run inside transaction(); nothing is committed here.
     """
-    cursor = conn.cursor()
+    batch = RowBatch(conn)
     
     print("\n=== Fetching Weekly Projections from Box Scores ===")
     
@@ -507,30 +719,44 @@ def update_weekly_projections_from_box_scores(league: League, conn: sqlite3.Conn
     
     total_updated = 0
     
+    def fetch(week):
+        try:
+            return league.box_scores(week=week)
+        except Exception as e:
+            return e
+    
+    # Weeks are independent requests, so fetch them concurrently. The writes below
+    # stay on this thread since the connection must not be shared across threads.
+    with ThreadPoolExecutor(max_workers=BOX_SCORE_WORKERS) as executor:
+        box_scores_by_week = dict(zip(weeks, executor.map(fetch, weeks)))
+    
     for week in weeks:
         print(f"  Fetching box scores for Week {week}...")
         try:
-            box_scores = league.box_scores(week=week)
+            box_scores = box_scores_by_week[week]
+            if isinstance(box_scores, Exception):
+                raise box_scores
             
             players_updated = 0
             for matchup in box_scores:
                 # Process home team lineup
                 for box_player in matchup.home_lineup:
-                    if process_box_player(cursor, box_player, week):
+                    if process_box_player(batch, box_player, week):
                         players_updated += 1
                 
                 # Process away team lineup
                 for box_player in matchup.away_lineup:
-                    if process_box_player(cursor, box_player, week):
+                    if process_box_player(batch, box_player, week):
                         players_updated += 1
             
-            conn.commit()
             print(f"    Updated {players_updated} player projections for Week {week}")
             total_updated += players_updated
             
         except Exception as e:
             print(f"    Error fetching Week {week} box scores: {e}")
     
+    batch.flush()
+    
     print(f"  Box score projections complete! Total updates: {total_updated}")
     return total_updated
 
@@ -540,10 +766,15 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
     Fetch all players in the league (rostered + free agents) and store in database.
     Rostered players ALWAYS get full updates (they need current projections).
     Free agents use incremental updates - only fetches if missing data.
+    Run inside transaction(); nothing is committed here.
     """
-    existing_ids = get_existing_player_ids(conn) if not force else set()
+    # stored_ids tracks what is actually in the players table (for choosing between
+    # a full insert and a partial update); existing_ids drives incremental fetching
+    stored_ids = get_existing_player_ids(conn)
+    existing_ids = stored_ids.copy() if not force else set()
     players_needing_stats = get_players_needing_stats(conn) if not force else set()
     
+    batch = RowBatch(conn)
     processed_ids = set()
     new_players = 0
     updated_players = 0
@@ -554,6 +785,16 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
     print(f"  Players needing more stats: {len(players_needing_stats)}")
     print("  NOTE: All rostered players will be updated with latest data")
     
+    # Fetch full info for every rostered non-D/ST player up front, in batched
+    # player_info requests instead of one request per player
+    roster_ids = []
+    for team in league.teams:
+        for player in team.roster:
+            player_id = get_player_id(player)
+            if player_id is not None and getattr(player, 'position', '') != 'D/ST':
+                roster_ids.append(player_id)
+    full_players = fetch_player_infos(league, list(dict.fromkeys(roster_ids)))
+    
     # First, get all rostered players - ALWAYS update these
     for team in league.teams:
         print(f"Processing team: {team.team_name}")
@@ -572,18 +813,18 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
                 
                 if position == 'D/ST':
                     # For D/ST, just insert from roster data (player_info often fails)
-                    insert_or_update_player(conn, player, force_update=True)
+                    insert_or_update_player(batch, stored_ids, player, force_update=True)
                     if player_id not in existing_ids:
                         new_players += 1
                     else:
                         updated_players += 1
                 else:
-                    # For regular players, get full info
-                    full_player = league.player_info(playerId=player_id)
+                    # For regular players, use the prefetched full info
+                    full_player = full_players.get(player_id)
                     if full_player:
-                        insert_or_update_player(conn, player, full_player, force_update=True)
+                        insert_or_update_player(batch, stored_ids, player, full_player, force_update=True)
                     else:
-                        insert_or_update_player(conn, player, force_update=True)
+                        insert_or_update_player(batch, stored_ids, player, force_update=True)
                     
                     if player_id not in existing_ids:
                         new_players += 1
@@ -599,7 +840,7 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
                 print(f"  Error processing {get_player_name(player)}: {e}")
                 # Still try to insert basic player info
                 try:
-                    insert_or_update_player(conn, player, force_update=False)
+                    insert_or_update_player(batch, stored_ids, player, force_update=False)
                     processed_ids.add(player_id)
                     updated_players += 1
                 except Exception as e2:
@@ -610,12 +851,35 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
     # Now fetch free agents
     print("\n=== Fetching Free Agents ===")
     positions = ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']
+    rostered_ids = frozenset(processed_ids)
+    
+    def fetch_position(position):
+        # Fetch free agents for this position, then batch-fetch full info for the
+        # ones that need it
+        free_agents = league.free_agents(position=position, size=500)
+        fetch_ids = []
+        if position != 'D/ST':
+            for player in free_agents:
+                player_id = get_player_id(player)
+                if player_id is None or player_id in rostered_ids:
+                    continue
+                if force or player_id not in existing_ids or player_id in players_needing_stats:
+                    fetch_ids.append(player_id)
+        return free_agents, fetch_player_infos(league, list(dict.fromkeys(fetch_ids)))
+    
+    # One background thread fetches the positions in order, so later positions
+    # keep downloading while earlier ones are written from this thread (the only
+    # one that touches the connection). A single thread keeps the requests in
+    # flight at fetch_player_infos' own PLAYER_INFO_WORKERS, within the pooled
+    # HTTP session's connection limit, instead of one such pool per position
+    executor = ThreadPoolExecutor(max_workers=1)
+    futures = {position: executor.submit(fetch_position, position) for position in positions}
+    executor.shutdown(wait=False)
     
     for position in positions:
         print(f"\nFetching {position} free agents...")
         try:
-            # Fetch free agents for this position
-            free_agents = league.free_agents(position=position, size=500)
+            free_agents, full_players = futures[position].result()
             
             fa_new = 0
             fa_updated = 0
@@ -639,13 +903,13 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
                     if needs_full_fetch:
                         # D/ST - skip player_info (often fails), just use basic data
                         if position == 'D/ST':
-                            insert_or_update_player(conn, player, force_update=force)
+                            insert_or_update_player(batch, stored_ids, player, force_update=force)
                         else:
-                            full_player = league.player_info(playerId=player_id)
+                            full_player = full_players.get(player_id)
                             if full_player:
-                                insert_or_update_player(conn, player, full_player, force_update=force)
+                                insert_or_update_player(batch, stored_ids, player, full_player, force_update=force)
                             else:
-                                insert_or_update_player(conn, player, force_update=force)
+                                insert_or_update_player(batch, stored_ids, player, force_update=force)
                         
                         if player_id not in existing_ids:
                             fa_new += 1
@@ -654,7 +918,7 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
                             fa_updated += 1
                             updated_players += 1
                     else:
-                        insert_or_update_player(conn, player, force_update=False)
+                        insert_or_update_player(batch, stored_ids, player, force_update=False)
                         fa_skipped += 1
                         skipped_players += 1
                     
@@ -666,7 +930,7 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
                 except Exception as e:
                     # Still try to insert basic player info
                     try:
-                        insert_or_update_player(conn, player, force_update=False)
+                        insert_or_update_player(batch, stored_ids, player, force_update=False)
                         processed_ids.add(player_id)
                         fa_skipped += 1
                         skipped_players += 1
@@ -678,6 +942,9 @@ def fetch_all_players(league: League, conn: sqlite3.Connection, force: bool = Fa
         except Exception as e:
             print(f"  Error fetching {position} free agents: {e}")
     
+    # Write whatever is still buffered (the caller commits the whole load at once)
+    batch.flush()
+    
     print(f"\n=== Complete ===")
     print(f"Total: {new_players} new, {updated_players} updated, {skipped_players} skipped")
     
@@ -716,32 +983,55 @@ def main():
         return
     
     print(f"\nOpening database: {args.db}")
-    conn = create_database(args.db)
+    conn = create_schema(args.db)
+    player_db.remove_basic_catalog(args.db)
     
-    if args.projections_only:
-        print("\n*** Projections-only mode ***")
-    else:
-        print("\nFetching players..." + (" (force mode)" if args.force else " (incremental mode)"))
-        total = fetch_all_players(league, conn, force=args.force)
+    drop_indexes(conn)
+    try:
+        if args.projections_only:
+            print("\n*** Projections-only mode ***")
+        else:
+            print("\nFetching players..." + (" (force mode)" if args.force else " (incremental mode)"))
+            with transaction(conn):
+                total = fetch_all_players(league, conn, force=args.force)
+        
+        # Fetch weekly projections from box scores (BoxPlayer has projected_points)
+        if not args.skip_projections:
+            with transaction(conn):
+                update_weekly_projections_from_box_scores(league, conn, current_week)
+        else:
+            print("\nSkipping box score projections (--skip-projections flag)")
+    finally:
+        # Rebuild indexes even if the load failed part-way
+        print("\nBuilding indexes...")
+        create_indexes(conn)
     
-    # Fetch weekly projections from box scores (BoxPlayer has projected_points)
-    if not args.skip_projections:
-        update_weekly_projections_from_box_scores(league, conn, current_week)
-    else:
-        print("\nSkipping box score projections (--skip-projections flag)")
+    # Pre-serialize each player so the API can return it without re-assembling
+    print("\nRefreshing serialized player payloads...")
+    refreshed = player_db.refresh_payloads(conn)
+    print(f"  Refreshed {refreshed} player payloads")
+    
+    # Pre-serialize the basic player catalog as well
+    cataloged = player_db.write_basic_catalog(args.db)
+    print(f"  Wrote {cataloged} players to {player_db.basic_catalog_path(args.db)}")
     
     # Print summary
+    # One statement; the three weekly stat counts come from a single scan
     cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM players")
-    player_count = cursor.fetchone()[0]
-    cursor.execute("SELECT COUNT(*) FROM player_weekly_stats")
-    stats_count = cursor.fetchone()[0]
-    cursor.execute("SELECT COUNT(*) FROM player_schedule")
-    schedule_count = cursor.fetchone()[0]
-    cursor.execute("SELECT COUNT(*) FROM player_weekly_stats WHERE projected_points > 0")
-    projections_count = cursor.fetchone()[0]
-    cursor.execute("SELECT COUNT(*) FROM player_weekly_stats WHERE points > 0")
-    actual_points_count = cursor.fetchone()[0]
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM players),
+            w.total, w.projections, w.actual_points,
+            (SELECT COUNT(*) FROM player_schedule)
+        FROM (
+            SELECT
+                COUNT(*) AS total,
+                COALESCE(SUM(projected_points > 0), 0) AS projections,
+                COALESCE(SUM(points > 0), 0) AS actual_points
+            FROM player_weekly_stats
+        ) w
+    """)
+    player_count, stats_count, projections_count, actual_points_count, schedule_count = cursor.fetchone()
     
     print(f"\n=== Database Summary ===")
     print(f"Players: {player_count}")
@@ -751,6 +1041,8 @@ def main():
     print(f"Schedule records: {schedule_count}")
     print(f"Database saved to: {args.db}")
     
+    # Refresh query planner statistics for the new data
+    conn.execute("PRAGMA optimize")
     conn.close()
 
 
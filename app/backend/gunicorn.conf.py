@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for serving the backend API in production.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+/parse-content spends most of its time waiting on ESPN, so each worker runs
+gevent green threads and keeps serving other requests during that I/O.
+Worker processes (one per core by default) cover the CPU-bound serialization.
+"""
+
+import multiprocessing
+import os
+
+
+bind = os.environ.get("BIND", "127.0.0.1:5000")
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = 100
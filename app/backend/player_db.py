@@ -3,207 +3,551 @@ Helper module to query the player SQLite database.
 Use this in app.py instead of calling league.player_info() on each request.
 """
 
+import atexit
 import json
+import os
 import sqlite3
-from typing import Optional, List, Dict, Any
+import threading
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 
 DB_PATH = "players.db"
 
+# Ids bound per IN (...) query, below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999)
+MAX_IDS_PER_QUERY = 900
 
-def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
-    """Get a database connection with row factory for dict-like access."""
-    conn = sqlite3.connect(db_path)
+
+# Read connections, one per database path, shared by every thread (or greenlet)
+# of the process and kept open between calls, each stored with the identity of
+# the file it was opened on. A connection can only run one call at a time, so
+# every use of one holds _read_lock.
+_connections: Dict[str, Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]] = {}
+_read_lock = threading.RLock()
+
+
+def _file_identity(db_path: str) -> Optional[Tuple[int, int]]:
+    """Device and inode of db_path, or None when it doesn't exist."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open a read-only connection to db_path (with row factory for dict-like access)."""
+    conn = sqlite3.connect(db_path, cached_statements=256, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA query_only=1")
     return conn
 
 
-def get_player(player_id: int, db_path: str = DB_PATH) -> Optional[Dict[str, Any]]:
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
     """
-    Get a player by ID with all their stats, schedule, and season totals.
-    Returns data in the same format as serialize_player() from app.py.
+    Get the process-wide read-only connection to db_path (with row factory for
+    dict-like access). Hold _read_lock while using it, and don't close it.
+    The connection is reopened when the file has been replaced (e.g. a rebuilt
+    database moved into place), since the old one keeps reading the old file.
+    The journal mode is left to build_player_db.py, which creates the database
+    in WAL mode so these reads can run while it writes.
     """
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-    
-    # Get basic player info
-    cursor.execute("SELECT * FROM players WHERE player_id = ?", (player_id,))
-    row = cursor.fetchone()
-    
-    if not row:
-        conn.close()
-        return None
-    
-    player = {
-        "name": row["name"],
-        "playerId": row["player_id"],
-        "position": row["position"],
-        "posRank": row["pos_rank"],
-        "eligibleSlots": json.loads(row["eligible_slots"]) if row["eligible_slots"] else [],
+    with _read_lock:
+        identity = _file_identity(db_path)
+        cached = _connections.get(db_path)
+        if cached is not None:
+            if cached[1] == identity:
+                return cached[0]
+            cached[0].close()
+        
+        conn = _open_connection(db_path)
+        # connect() creates a missing file, so take the identity after opening
+        _connections[db_path] = (conn, _file_identity(db_path))
+        return conn
+
+
+@atexit.register
+def close_connections():
+    """Close the cached read connections."""
+    with _read_lock:
+        for conn, _ in _connections.values():
+            conn.close()
+        _connections.clear()
+
+
+# Canonical copies of low-cardinality strings (positions, teams, injury statuses),
+# so thousands of rows share ~40 str objects instead of allocating one per row
+_STR_POOL: Dict[str, str] = {}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return _STR_POOL.setdefault(value, value) if value else value
+
+
+def _player_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Build the base player dict (no stats/schedule yet) from a PLAYER_COLUMNS row."""
+    # Unpack by position - Row lookups by name scan the column names on every access
+    (player_id, name, position, pro_team, pos_rank, eligible_slots, injury_status, injured,
+     total_points, projected_total_points, avg_points, projected_avg_points,
+     percent_owned, percent_started, headshot_url) = row
+    return {
+        "name": name,
+        "playerId": player_id,
+        "position": _intern(position),
+        "posRank": pos_rank,
+        "eligibleSlots": _loads(eligible_slots) if eligible_slots else [],
         "lineupSlot": None,  # Will be set by roster data
         "acquisitionType": None,  # Will be set by roster data
-        "proTeam": row["pro_team"],
+        "proTeam": _intern(pro_team),
         "onTeamId": None,  # Will be set by roster data
-        "injuryStatus": row["injury_status"],
-        "injured": bool(row["injured"]),
-        "total_points": row["total_points"] or 0,
-        "projected_total_points": row["projected_total_points"] or 0,
-        "avg_points": row["avg_points"] or 0,
-        "projected_avg_points": row["projected_avg_points"] or 0,
-        "percent_owned": row["percent_owned"] or 0,
-        "percent_started": row["percent_started"] or 0,
-        "headshotUrl": row["headshot_url"],
+        "injuryStatus": _intern(injury_status),
+        "injured": bool(injured),
+        "total_points": total_points,
+        "projected_total_points": projected_total_points,
+        "avg_points": avg_points,
+        "projected_avg_points": projected_avg_points,
+        "percent_owned": percent_owned,
+        "percent_started": percent_started,
+        "headshotUrl": headshot_url,
         "stats": {},
         "seasonTotals": None,
         "schedule": {},
     }
+
+
+def _weekly_stats_from_row(stat_row: sqlite3.Row) -> Dict[str, Any]:
+    """Build one week's stats entry from a _SQL_STATS_BY_IDS row."""
+    _, _, points, projected_points, avg_points, breakdown, projected_breakdown = stat_row
+    return {
+        "points": points,
+        "projected_points": projected_points,
+        "avg_points": avg_points,
+        "breakdown": _loads(breakdown) if breakdown else {},
+        "projected_breakdown": _loads(projected_breakdown) if projected_breakdown else {},
+    }
+
+
+def _season_totals_from_row(totals_row: sqlite3.Row) -> Dict[str, Any]:
+    """Build the seasonTotals entry from a _SQL_TOTALS_BY_IDS row."""
+    _, points, projected_points, avg_points, projected_avg_points, breakdown, projected_breakdown = totals_row
+    return {
+        "points": points,
+        "projected_points": projected_points,
+        "avg_points": avg_points,
+        "projected_avg_points": projected_avg_points,
+        "breakdown": _loads(breakdown) if breakdown else {},
+        "projected_breakdown": _loads(projected_breakdown) if projected_breakdown else {},
+    }
+
+
+def _schedule_from_row(sched_row: sqlite3.Row) -> Dict[str, Any]:
+    """Build one week's schedule entry from a _SQL_SCHEDULE_BY_IDS row."""
+    _, _, opponent_team, game_date = sched_row
+    return {
+        "team": _intern(opponent_team) or "",
+        "date": game_date,
+    }
+
+
+# Columns needed to build a player dict (everything except the payload blob).
+# Numbers are defaulted in SQL with IFNULL(NULLIF(x, 0), 0), i.e. Python's "x or 0".
+PLAYER_COLUMNS = """
+    player_id, name, position, pro_team, pos_rank, eligible_slots, injury_status, injured,
+    IFNULL(NULLIF(total_points, 0), 0) AS total_points,
+    IFNULL(NULLIF(projected_total_points, 0), 0) AS projected_total_points,
+    IFNULL(NULLIF(avg_points, 0), 0) AS avg_points,
+    IFNULL(NULLIF(projected_avg_points, 0), 0) AS projected_avg_points,
+    IFNULL(NULLIF(percent_owned, 0), 0) AS percent_owned,
+    IFNULL(NULLIF(percent_started, 0), 0) AS percent_started,
+    headshot_url
+"""
+
+# Query text is kept constant so SQLite's statement cache can reuse the compiled
+# statements. {placeholders} is filled with one "?" per id.
+_SQL_PLAYERS_BY_IDS = f"SELECT {PLAYER_COLUMNS} FROM players WHERE player_id IN ({{placeholders}})"
+
+_SQL_STATS_BY_IDS = """
+    SELECT player_id, week,
+        IFNULL(NULLIF(points, 0), 0) AS points,
+        IFNULL(NULLIF(projected_points, 0), 0) AS projected_points,
+        IFNULL(NULLIF(avg_points, 0), 0) AS avg_points,
+        breakdown, projected_breakdown
+    FROM player_weekly_stats
+    WHERE player_id IN ({placeholders})
+    ORDER BY player_id, week
+"""
+
+_SQL_TOTALS_BY_IDS = """
+    SELECT player_id,
+        IFNULL(NULLIF(points, 0), 0) AS points,
+        IFNULL(NULLIF(projected_points, 0), 0) AS projected_points,
+        IFNULL(NULLIF(avg_points, 0), 0) AS avg_points,
+        IFNULL(NULLIF(projected_avg_points, 0), 0) AS projected_avg_points,
+        breakdown, projected_breakdown
+    FROM player_season_totals
+    WHERE player_id IN ({placeholders})
+"""
+
+_SQL_SCHEDULE_BY_IDS = """
+    SELECT player_id, week, opponent_team, game_date
+    FROM player_schedule
+    WHERE player_id IN ({placeholders})
+    ORDER BY player_id, week
+"""
+
+_SQL_PAYLOADS_BY_IDS = "SELECT player_id, payload FROM players WHERE player_id IN ({placeholders})"
+
+_SQL_COUNT_PLAYERS = "SELECT COUNT(*) FROM players"
+
+_SQL_HAS_PLAYERS = "SELECT EXISTS(SELECT 1 FROM players)"
+
+
+# Search result columns, already named the way the API returns them. The numbers
+# use IFNULL(NULLIF(x, 0), 0), which is SQL for Python's "x or 0".
+SEARCH_COLUMNS = """
+    name, player_id AS playerId, position, pos_rank AS posRank, pro_team AS proTeam,
+    injury_status AS injuryStatus,
+    IFNULL(NULLIF(total_points, 0), 0) AS total_points,
+    IFNULL(NULLIF(projected_total_points, 0), 0) AS projected_total_points,
+    IFNULL(NULLIF(avg_points, 0), 0) AS avg_points,
+    IFNULL(NULLIF(percent_owned, 0), 0) AS percent_owned,
+    headshot_url AS headshotUrl
+"""
+
+
+def _build_search_sql(mask: int) -> str:
+    """Build the search_players query for a mask of name(4)/position(2)/pro_team(1) filters."""
+    query = f"SELECT {SEARCH_COLUMNS} FROM players WHERE 1=1"
+    if mask & 4:
+        query += " AND name LIKE ?"
+    if mask & 2:
+        query += " AND position = ?"
+    if mask & 1:
+        query += " AND pro_team = ?"
+    return query + " ORDER BY players.total_points DESC LIMIT ?"
+
+
+# Every combination of search filters, built once
+_SQL_SEARCH = {mask: _build_search_sql(mask) for mask in range(8)}
+
+
+def _assemble_players(cursor: sqlite3.Cursor, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Build player dicts from the players/stats/totals/schedule tables with one
+    IN (...) query per table. Returns a dict mapping player_id to player data.
+    """
+    placeholders = ",".join("?" * len(player_ids))
     
-    # Get weekly stats
-    cursor.execute("""
-        SELECT week, points, projected_points, avg_points, breakdown, projected_breakdown
-        FROM player_weekly_stats
-        WHERE player_id = ?
-        ORDER BY week
-    """, (player_id,))
+    cursor.execute(_SQL_PLAYERS_BY_IDS.format(placeholders=placeholders), player_ids)
+    result = {row[0]: _player_from_row(row) for row in cursor.fetchall()}
     
+    cursor.execute(_SQL_STATS_BY_IDS.format(placeholders=placeholders), player_ids)
     for stat_row in cursor.fetchall():
-        player["stats"][str(stat_row["week"])] = {
-            "points": stat_row["points"] or 0,
-            "projected_points": stat_row["projected_points"] or 0,
-            "avg_points": stat_row["avg_points"] or 0,
-            "breakdown": json.loads(stat_row["breakdown"]) if stat_row["breakdown"] else {},
-            "projected_breakdown": json.loads(stat_row["projected_breakdown"]) if stat_row["projected_breakdown"] else {},
-        }
+        player = result.get(stat_row[0])
+        if player:
+            player["stats"][str(stat_row[1])] = _weekly_stats_from_row(stat_row)
     
-    # Get season totals
-    cursor.execute("""
-        SELECT points, projected_points, avg_points, projected_avg_points, breakdown, projected_breakdown
-        FROM player_season_totals
-        WHERE player_id = ?
-    """, (player_id,))
+    cursor.execute(_SQL_TOTALS_BY_IDS.format(placeholders=placeholders), player_ids)
+    for totals_row in cursor.fetchall():
+        player = result.get(totals_row[0])
+        if player:
+            player["seasonTotals"] = _season_totals_from_row(totals_row)
     
-    totals_row = cursor.fetchone()
-    if totals_row:
-        player["seasonTotals"] = {
-            "points": totals_row["points"] or 0,
-            "projected_points": totals_row["projected_points"] or 0,
-            "avg_points": totals_row["avg_points"] or 0,
-            "projected_avg_points": totals_row["projected_avg_points"] or 0,
-            "breakdown": json.loads(totals_row["breakdown"]) if totals_row["breakdown"] else {},
-            "projected_breakdown": json.loads(totals_row["projected_breakdown"]) if totals_row["projected_breakdown"] else {},
-        }
+    cursor.execute(_SQL_SCHEDULE_BY_IDS.format(placeholders=placeholders), player_ids)
+    for sched_row in cursor.fetchall():
+        player = result.get(sched_row[0])
+        if player:
+            player["schedule"][str(sched_row[1])] = _schedule_from_row(sched_row)
     
-    # Get schedule
-    cursor.execute("""
-        SELECT week, opponent_team, game_date
-        FROM player_schedule
-        WHERE player_id = ?
-        ORDER BY week
-    """, (player_id,))
+    return result
+
+
+def _load_players(cursor: sqlite3.Cursor, player_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Load players from their pre-serialized payload blobs, assembling from the
+    stats tables only for players without one (or databases built before the
+    payload column existed).
+    """
+    placeholders = ",".join("?" * len(player_ids))
+    try:
+        cursor.execute(_SQL_PAYLOADS_BY_IDS.format(placeholders=placeholders), player_ids)
+    except sqlite3.OperationalError:
+        return _assemble_players(cursor, player_ids)
     
-    for sched_row in cursor.fetchall():
-        player["schedule"][str(sched_row["week"])] = {
-            "team": sched_row["opponent_team"] or "",
-            "date": sched_row["game_date"],
-        }
+    result = {}
+    missing_ids = []
+    for player_id, payload in cursor.fetchall():
+        if payload:
+            result[player_id] = _loads(payload)
+        else:
+            missing_ids.append(player_id)
     
-    conn.close()
-    return player
+    if missing_ids:
+        result.update(_assemble_players(cursor, missing_ids))
+    return result
 
 
-def get_players_by_ids(player_ids: List[int], db_path: str = DB_PATH) -> Dict[int, Dict[str, Any]]:
+# Single-player lookups cached per database version (see _db_version)
+PLAYER_CACHE_SIZE = 4096
+
+
+def _db_version(db_path: str) -> Tuple[Optional[int], Optional[int]]:
     """
-    Get multiple players by their IDs.
-    Returns a dict mapping player_id to player data.
+    Modification times of the database file and its WAL file. Commits land in
+    the WAL first, so both are needed to notice a rebuild.
+    """
+    versions = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            versions.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            versions.append(None)
+    return tuple(versions)
+
+
+@lru_cache(maxsize=PLAYER_CACHE_SIZE)
+def _get_player_cached(player_id: int, db_path: str, version: tuple) -> Optional[Dict[str, Any]]:
+    with _read_lock:
+        conn = get_connection(db_path)
+        return _load_players(conn.cursor(), [player_id]).get(player_id)
+
+
+def get_player(player_id: int, db_path: str = DB_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Get a player by ID with all their stats, schedule, and season totals.
+    Returns data in the same format as serialize_player() from app.py.
+    Results are cached until the database changes; callers get a shallow copy,
+    so they can set the roster fields but must not mutate nested values.
+    """
+    player = _get_player_cached(player_id, db_path, _db_version(db_path))
+    return dict(player) if player else None
+
+
+def get_player_raw_json(player_id: int, db_path: str = DB_PATH) -> Optional[bytes]:
+    """
+    Get a player as encoded JSON, for responses that only forward it.
+    Returns the stored payload blob as-is, encoding from the tables only when
+    the player has no payload yet. Cached like get_player().
     """
+    return _get_player_raw_json_cached(player_id, db_path, _db_version(db_path))
+
+
+@lru_cache(maxsize=PLAYER_CACHE_SIZE)
+def _get_player_raw_json_cached(player_id: int, db_path: str, version: tuple) -> Optional[bytes]:
+    with _read_lock:
+        cursor = get_connection(db_path).cursor()
+        try:
+            cursor.execute(_SQL_PAYLOADS_BY_IDS.format(placeholders="?"), (player_id,))
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row and row[1]:
+            return bytes(row[1])
+        
+        player = _assemble_players(cursor, [player_id]).get(player_id)
+    return _dumps(player) if player else None
+
+
+def get_players_bulk(player_ids: List[int], db_path: str = DB_PATH) -> Dict[int, Dict[str, Any]]:
+    """
+    Get multiple players with full stats, schedule, and season totals.
+    Uses one connection and IN (...) queries instead of a get_player()
+    round-trip per id. Returns a dict mapping player_id to player data.
+    """
+    if not player_ids:
+        return {}
+    
     result = {}
-    for player_id in player_ids:
-        player = get_player(player_id, db_path)
-        if player:
-            result[player_id] = player
+    with _read_lock:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+        for start in range(0, len(player_ids), MAX_IDS_PER_QUERY):
+            result.update(_load_players(cursor, player_ids[start:start + MAX_IDS_PER_QUERY]))
     return result
 
 
+def refresh_payloads(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """
+    Rebuild the pre-serialized payload blob of every player from the stats,
+    season totals and schedule tables. Run after the tables have been written.
+    Returns the number of players refreshed.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute("SELECT player_id FROM players")
+    player_ids = [row[0] for row in cursor.fetchall()]
+    
+    for start in range(0, len(player_ids), batch_size):
+        players = _assemble_players(cursor, player_ids[start:start + batch_size])
+        cursor.executemany(
+            "UPDATE players SET payload = ? WHERE player_id = ?",
+            ((_dumps(player), player_id) for player_id, player in players.items())
+        )
+    conn.commit()
+    return len(player_ids)
+
+
+def get_players_by_ids(player_ids: List[int], db_path: str = DB_PATH) -> Dict[int, Dict[str, Any]]:
+    """
+    Get multiple players by their IDs.
+    Returns a dict mapping player_id to player data, in the order of player_ids.
+    """
+    players = get_players_bulk(player_ids, db_path)
+    return {player_id: players[player_id] for player_id in player_ids if player_id in players}
+
+
+def _search_result_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Build a search result from a SEARCH_COLUMNS row."""
+    player = dict(row)
+    player["position"] = _intern(player["position"])
+    player["proTeam"] = _intern(player["proTeam"])
+    player["injuryStatus"] = _intern(player["injuryStatus"])
+    return player
+
+
+def _iter_search_rows(conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> Iterator[Dict[str, Any]]:
+    """Yield search results from cursor, closing its connection once they run out."""
+    try:
+        for row in cursor:
+            yield _search_result_from_row(row)
+    finally:
+        conn.close()
+
+
 def search_players(
     name: Optional[str] = None,
     position: Optional[str] = None,
     pro_team: Optional[str] = None,
     limit: int = 100,
-    db_path: str = DB_PATH
-) -> List[Dict[str, Any]]:
+    db_path: str = DB_PATH,
+    yield_rows: bool = False
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Search for players by name, position, or team.
-    Returns basic player info (not full stats).
+    Returns basic player info (not full stats). With yield_rows=True, returns an
+    iterator that reads the rows from the cursor as it is consumed. It reads
+    through a connection of its own: an open statement holds its connection's
+    read snapshot, and the shared one would serve stale players meanwhile.
     """
-    conn = get_connection(db_path)
-    cursor = conn.cursor()
-    
-    query = "SELECT * FROM players WHERE 1=1"
+    mask = 0
     params = []
     
     if name:
-        query += " AND name LIKE ?"
+        mask |= 4
         params.append(f"%{name}%")
     
     if position:
-        query += " AND position = ?"
+        mask |= 2
         params.append(position)
     
     if pro_team:
-        query += " AND pro_team = ?"
+        mask |= 1
         params.append(pro_team)
     
-    query += " ORDER BY total_points DESC LIMIT ?"
     params.append(limit)
     
-    cursor.execute(query, params)
+    if yield_rows:
+        conn = _open_connection(db_path)
+        try:
+            cursor = conn.execute(_SQL_SEARCH[mask], params)
+        except:
+            conn.close()
+            raise
+        return _iter_search_rows(conn, cursor)
     
-    players = []
-    for row in cursor.fetchall():
-        players.append({
-            "name": row["name"],
-            "playerId": row["player_id"],
-            "position": row["position"],
-            "posRank": row["pos_rank"],
-            "proTeam": row["pro_team"],
-            "injuryStatus": row["injury_status"],
-            "total_points": row["total_points"] or 0,
-            "projected_total_points": row["projected_total_points"] or 0,
-            "avg_points": row["avg_points"] or 0,
-            "percent_owned": row["percent_owned"] or 0,
-            "headshotUrl": row["headshot_url"],
-        })
-    
-    conn.close()
-    return players
+    with _read_lock:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+        cursor.execute(_SQL_SEARCH[mask], params)
+        rows = cursor.fetchall()
+    return [_search_result_from_row(row) for row in rows]
+
 
+# Row limit of the basic player catalog
+ALL_PLAYERS_LIMIT = 10000
 
-def get_all_players_basic(db_path: str = DB_PATH) -> List[Dict[str, Any]]:
-    """Get basic info for all players (without full stats)."""
-    return search_players(limit=10000, db_path=db_path)
+
+def basic_catalog_path(db_path: str = DB_PATH) -> str:
+    """Path of the pre-serialized basic player catalog written next to the database."""
+    return os.path.splitext(db_path)[0] + "_basic.json"
+
+
+def write_basic_catalog(db_path: str = DB_PATH) -> int:
+    """
+    Write the basic info of all players to basic_catalog_path() as JSON, so
+    the /api/players route can send it as a file without querying. Run at the
+    end of a build. Returns the number of players written.
+    """
+    players = search_players(limit=ALL_PLAYERS_LIMIT, db_path=db_path)
+    path = basic_catalog_path(db_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(players))
+    os.replace(tmp_path, path)
+    return len(players)
+
+
+def remove_basic_catalog(db_path: str = DB_PATH):
+    """Remove the catalog file at the start of a build, so a failed build can't leave a stale one."""
+    try:
+        os.remove(basic_catalog_path(db_path))
+    except FileNotFoundError:
+        pass
+
+
+def get_all_players_basic(db_path: str = DB_PATH, yield_rows: bool = False) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Get basic info for all players (without full stats).
+    The list is read from the catalog file written by the build when there is
+    one. With yield_rows=True the rows are streamed from the database instead,
+    as loading the file would hold the whole catalog in memory anyway.
+    """
+    if not yield_rows:
+        try:
+            with open(basic_catalog_path(db_path), "rb") as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            pass
+    return search_players(limit=ALL_PLAYERS_LIMIT, db_path=db_path, yield_rows=yield_rows)
 
 
 def database_exists(db_path: str = DB_PATH) -> bool:
     """Check if the player database exists and has data."""
     try:
-        conn = get_connection(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM players")
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count > 0
-    except:
+        with _read_lock:
+            conn = get_connection(db_path)
+            cursor = conn.cursor()
+            # Stops at the first row instead of counting them all
+            cursor.execute(_SQL_HAS_PLAYERS)
+            return bool(cursor.fetchone()[0])
+    except sqlite3.Error:
+        # Missing players table (or not a database at all)
         return False
 
 
 def get_player_count(db_path: str = DB_PATH) -> int:
     """Get the total number of players in the database."""
     try:
-        conn = get_connection(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM players")
-        count = cursor.fetchone()[0]
-        conn.close()
+        with _read_lock:
+            conn = get_connection(db_path)
+            cursor = conn.cursor()
+            cursor.execute(_SQL_COUNT_PLAYERS)
+            count = cursor.fetchone()[0]
         return count
     except:
         return 0